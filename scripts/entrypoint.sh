@@ -15,8 +15,8 @@ source /app/.venv/bin/activate
 # Create logs directory
 mkdir -p /app/logs
 
-# Check CUDA availability
-if ! python3 -c "import torch; assert torch.cuda.is_available(), 'CUDA not available'"; then
+# Check CUDA availability and capture the CUDA version in one torch import
+if ! CUDA_VERSION=$(python3 -c "import torch; assert torch.cuda.is_available(), 'CUDA not available'; print(torch.version.cuda)"); then
     echo "Error: CUDA is not available"
     exit 1
 fi
@@ -31,7 +31,6 @@ if [ "$DEBUG" = "true" ]; then
 fi
 
 # Check CUDA version
-CUDA_VERSION=$(python3 -c "import torch; print(torch.version.cuda)")
 if [[ "${CUDA_VERSION}" != "12.6" ]]; then
     echo "Warning: Container CUDA version (${CUDA_VERSION}) differs from host CUDA version (12.6)"
 fi
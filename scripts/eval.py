@@ -19,6 +19,7 @@
 import os
 import json
 import shutil
+import subprocess
 import torch
 import asyncio
 import argparse
@@ -166,17 +167,17 @@ class Evaluator:
                 os.makedirs(results_dir, exist_ok=True)
 
                 # Run evaluation
-                lm_eval_command = (
-                    f"lm-eval "
-                    f"--model hf "
-                    f"--model_args pretrained={model_path},tokenizer={model_path} "
-                    f"--tasks {self.config.tasks} "
-                    f"--device {self.config.device} "
-                    f"--batch_size {self.config.actual_batch_size} "
-                    f"--output_path {results_dir}"
-                )
-
-                exit_code = os.system(lm_eval_command)
+                lm_eval_command = [
+                    "lm-eval",
+                    "--model", "hf",
+                    "--model_args", f"pretrained={model_path},tokenizer={model_path}",
+                    "--tasks", self.config.tasks,
+                    "--device", self.config.device,
+                    "--batch_size", str(self.config.actual_batch_size),
+                    "--output_path", results_dir,
+                ]
+
+                exit_code = subprocess.run(lm_eval_command).returncode
                 if exit_code != 0:
                     tplr.logger.error("Evaluation failed")
                     return global_step
@@ -5,6 +5,15 @@
 # Navigate to the script directory
 cd "$(dirname "$0")"
 
+# curl is used to probe node RPC readiness after startup
+if ! command -v curl > /dev/null; then
+  echo "*** ERROR: curl is required but was not found in PATH"
+  exit 1
+fi
+
+# Single source of truth for the node image; docker-compose.yaml reads it too
+export SUBTENSOR_IMAGE=${SUBTENSOR_IMAGE:-ghcr.io/opentensor/subtensor:v2.0.4}
+
 # Create directories
 mkdir -p data/alice data/bob chain-specs
 
@@ -17,27 +26,71 @@ else
   echo "*** Purging previous state skipped..."
 fi
 
-# Generate chain spec using a temporary container
-echo "*** Building chainspec..."
-docker run --rm -v "$(pwd)/chain-specs:/chain-specs" ghcr.io/opentensor/subtensor:v2.0.4 \
-  /usr/local/bin/node-subtensor build-spec --disable-default-bootnode --raw --chain local > chain-specs/local.json
-echo "*** Chainspec built and output to file"
+# Generate chain spec using a temporary container, reusing the previous one
+# when it was built from the same image ID (a tag can be re-pushed)
+image_id=$(docker image inspect --format '{{.Id}}' "$SUBTENSOR_IMAGE" 2>/dev/null)
+if [ -n "$image_id" ] && [ -s chain-specs/local.json ] \
+  && [ "$(cat chain-specs/local.json.image 2>/dev/null)" = "$image_id" ]; then
+  echo "*** Reusing chainspec built from $SUBTENSOR_IMAGE ($image_id)"
+else
+  echo "*** Building chainspec..."
+  rm -f chain-specs/local.json.image
+  if ! docker run --rm -v "$(pwd)/chain-specs:/chain-specs" "$SUBTENSOR_IMAGE" \
+    /usr/local/bin/node-subtensor build-spec --disable-default-bootnode --raw --chain local > chain-specs/local.json.tmp; then
+    rm -f chain-specs/local.json.tmp
+    echo "*** ERROR: chainspec build failed"
+    exit 1
+  fi
+  mv chain-specs/local.json.tmp chain-specs/local.json
+  # docker run may have just pulled the image, so resolve its ID again
+  image_id=$(docker image inspect --format '{{.Id}}' "$SUBTENSOR_IMAGE" 2>/dev/null)
+  if [ -n "$image_id" ]; then
+    echo "$image_id" > chain-specs/local.json.image
+  fi
+  echo "*** Chainspec built and output to file"
+fi
 
-# Generate node keys for Alice and Bob
+# Generate node keys for Alice and Bob in parallel, keeping any that survived --no-purge
 echo "*** Generating node keys..."
-docker run --rm -v "$(pwd)/data/alice:/data" ghcr.io/opentensor/subtensor:v2.0.4 \
-  /usr/local/bin/node-subtensor key generate-node-key --file /data/node.key
-docker run --rm -v "$(pwd)/data/bob:/data" ghcr.io/opentensor/subtensor:v2.0.4 \
-  /usr/local/bin/node-subtensor key generate-node-key --file /data/node.key
+pids=()
+for node in alice bob; do
+  if [ -f "data/$node/node.key" ]; then
+    echo "*** Reusing existing node key for $node"
+    continue
+  fi
+  docker run --rm -v "$(pwd)/data/$node:/data" "$SUBTENSOR_IMAGE" \
+    /usr/local/bin/node-subtensor key generate-node-key --file /data/node.key &
+  pids+=($!)
+done
+for p in "${pids[@]}"; do
+  wait "$p" || { echo "*** ERROR: node key generation failed"; exit 1; }
+done
 echo "*** Node keys generated"
 
 # Start the nodes
 echo "*** Starting localnet nodes with docker-compose..."
 docker compose up -d
 
-# Wait for nodes to start
+# Wait for both nodes to answer RPC instead of sleeping for a fixed time
 echo "*** Waiting for nodes to start..."
-sleep 10
+for port in 9944 9946; do
+  ready=false
+  deadline=$((SECONDS + 60))
+  while [ "$SECONDS" -lt "$deadline" ]; do
+    if curl -sf --max-time 2 -H "Content-Type: application/json" \
+      -d '{"jsonrpc":"2.0","id":1,"method":"system_health","params":[]}' \
+      "http://localhost:$port" > /dev/null; then
+      ready=true
+      break
+    fi
+    sleep 1
+  done
+  if [ "$ready" != true ]; then
+    echo "*** ERROR: node RPC on port $port did not become ready within 60s"
+    docker compose logs --tail=50
+    exit 1
+  fi
+done
 
 # Show logs to confirm startup
 echo "*** Node logs:"
@@ -20,6 +20,11 @@ async def precompute_shard_counts(
     from concurrent.futures import ThreadPoolExecutor, as_completed
     import yaml
 
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+
     # 1. Initialize S3 connection
     fs = s3fs.S3FileSystem(
         key=r2_access_key,
@@ -30,7 +35,7 @@ async def precompute_shard_counts(
     # 2. Load metadata
     def _load_metadata():
         with open(local_metadata_path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YamlLoader)
 
     metadata = await asyncio.to_thread(_load_metadata)
     configs = metadata.get("configs", [])
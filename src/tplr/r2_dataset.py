@@ -16,6 +16,7 @@
 # DEALINGS IN THE SOFTWARE.
 
 
+import os
 import json
 import yaml
 import s3fs
@@ -29,6 +30,12 @@ from tplr import logger
 from tplr.config import BUCKET_SECRETS
 from tplr.dataset import DatasetLoader
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 class R2DatasetLoader(DatasetLoader):
     """
@@ -302,16 +309,20 @@ class R2DatasetLoader(DatasetLoader):
             # Download and load shard sizes
             if not local_paths["shard_sizes"].exists():
                 logger.info("Downloading shard sizes from R2...")
-                fs.get(r2_paths["shard_sizes"], str(local_paths["shard_sizes"]))
+                R2DatasetLoader._download_to_cache(
+                    fs, r2_paths["shard_sizes"], local_paths["shard_sizes"]
+                )
             with open(local_paths["shard_sizes"]) as f:
                 R2DatasetLoader._shard_sizes = json.load(f)
 
             # Download and load metadata config
             if not local_paths["metadata"].exists():
                 logger.info("Downloading metadata config from R2...")
-                fs.get(r2_paths["metadata"], str(local_paths["metadata"]))
+                R2DatasetLoader._download_to_cache(
+                    fs, r2_paths["metadata"], local_paths["metadata"]
+                )
             with open(local_paths["metadata"]) as f:
-                R2DatasetLoader._metadata_config = yaml.safe_load(f)
+                R2DatasetLoader._metadata_config = yaml.load(f, Loader=YamlLoader)
 
             return (
                 R2DatasetLoader._shard_sizes,
@@ -322,6 +333,25 @@ class R2DatasetLoader(DatasetLoader):
             logger.error(f"Failed to load R2 metadata: {e}")
             raise
 
+    @staticmethod
+    def _download_to_cache(fs, remote_path: str, local_path: Path):
+        """
+        Downloads a file into the local cache atomically.
+
+        The file is fetched to a per-process temporary sibling and renamed into
+        place, so neither an interrupted download nor several miners/validators
+        populating a cold cache at once can leave a truncated cache entry.
+        """
+        # fs.get creates the file itself, so the cache entry keeps the usual
+        # umask permissions and stays readable by neurons run as other users
+        tmp_path = f"{local_path}.{os.getpid()}.tmp"
+        try:
+            fs.get(remote_path, tmp_path)
+            os.replace(tmp_path, local_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
     @staticmethod
     def _get_fs():
         if not R2DatasetLoader._fs:
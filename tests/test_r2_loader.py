@@ -1,5 +1,6 @@
 # ruff: noqa
 import os
+import stat
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -292,3 +293,58 @@ async def test_seed_consistency():
     logger.success(
         f"[green]Seed consistency test completed successfully ({T() - start_time:.2f}s)[/green]"
     )
+
+
+def test_download_to_cache_is_atomic(tmp_path, monkeypatch):
+    """
+    An interrupted metadata download must not leave a partial file in the cache,
+    a completed one lands at the target path with umask permissions, and
+    overlapping downloads of the same file from several processes must not
+    clobber each other's temp file.
+    """
+
+    class FlakyFS:
+        def __init__(self, fail):
+            self.fail = fail
+
+        def get(self, remote_path, local_path):
+            Path(local_path).write_text("configs: []\n")
+            if self.fail:
+                raise OSError("connection reset")
+
+    target = tmp_path / "metadata.yaml"
+
+    with pytest.raises(OSError):
+        R2DatasetLoader._download_to_cache(
+            FlakyFS(fail=True), "bucket/_metadata.yaml", target
+        )
+    assert list(tmp_path.iterdir()) == []
+
+    R2DatasetLoader._download_to_cache(
+        FlakyFS(fail=False), "bucket/_metadata.yaml", target
+    )
+    assert target.read_text() == "configs: []\n"
+    assert list(tmp_path.iterdir()) == [target]
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~umask
+
+    # Two processes racing on a cold cache: the first one's download starts,
+    # the second one completes entirely, then the first one finishes.
+    target.unlink()
+    pid = os.getpid()
+
+    class OverlappingFS:
+        def get(self, remote_path, local_path):
+            Path(local_path).write_text("configs: [a]\n")
+            with monkeypatch.context() as m:
+                m.setattr(os, "getpid", lambda: pid + 1)
+                R2DatasetLoader._download_to_cache(
+                    FlakyFS(fail=False), remote_path, target
+                )
+            with open(local_path, "a") as f:
+                f.write("# tail\n")
+
+    R2DatasetLoader._download_to_cache(OverlappingFS(), "bucket/_metadata.yaml", target)
+    assert target.read_text() == "configs: [a]\n# tail\n"
+    assert list(tmp_path.iterdir()) == [target]